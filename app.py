@@ -1,19 +1,27 @@
 from __future__ import annotations
 
+import atexit
 import base64
+import hashlib
+import hmac
 import io
 import json
 import os
+import threading
+import time
 import csv
 import datetime
+from collections import Counter, OrderedDict
+from dataclasses import asdict, dataclass, fields
 from pathlib import Path
 from urllib.parse import quote
 
-import qrcode
 from flask import (
     Flask,
     Response,
     abort,
+    g,
+    has_app_context,
     redirect,
     render_template,
     request,
@@ -23,8 +31,28 @@ from flask import (
 )
 from werkzeug.security import check_password_hash, generate_password_hash
 
+try:
+    # Optional: C-accelerated JSON for cards/counters files
+    import orjson
+except ImportError:
+    orjson = None
+
 app = Flask(__name__)
 
+
+def _json_loads(raw: bytes):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(data) -> bytes:
+    # Serialize in memory and write once, rather than json.dump()'s many small writes
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
 # -----------------------------
 # Simple counters + admin auth
 # -----------------------------
@@ -40,27 +68,110 @@ ADMIN_RESET_KEY = os.environ.get("ADMIN_RESET_KEY", "")  # set in Render env var
 # Multi-card directory
 # -----------------------------
 CARDS_FILE = os.environ.get("CARDS_FILE", "cards.json")
+DEFAULT_MAPS_DESTINATION = "208%20Weltevreden%20Road%2C%20Northcliff"
+
+
+@dataclass(frozen=True, slots=True)
+class Card:
+    """One card from cards.json, plus redirect URLs derived from it."""
+
+    slug: str
+    display_name: str = ""
+    contact_save_name: str = ""
+    org: str = ""
+    title: str = ""
+    whatsapp_display: str = ""
+    whatsapp_e164: str = ""
+    office_display: str = ""
+    office_e164: str = ""
+    email: str = ""
+    website_display: str = ""
+    website_url: str = ""
+    address_text: str = ""
+    maps_destination: str = DEFAULT_MAPS_DESTINATION
+    photo_filename: str = "profile.jpg"
+    logo_filename: str = "logo.png"
+    wa_base: str = ""
+    mailto_base: str = ""
+    map_url: str = ""
+
+
+_CARD_JSON_FIELDS = frozenset(f.name for f in fields(Card)) - {
+    "slug",
+    "wa_base",
+    "mailto_base",
+    "map_url",
+}
 
 
-def load_cards():
-    if not os.path.exists(CARDS_FILE):
+def _build_card(slug: str, raw: dict) -> Card:
+    values = {k: v for k, v in raw.items() if k in _CARD_JSON_FIELDS}
+    # Redirect targets are fixed per card, so build them once per load
+    destination = values.get("maps_destination", DEFAULT_MAPS_DESTINATION)
+    return Card(
+        slug=slug,
+        **values,
+        wa_base=f"https://wa.me/{values.get('whatsapp_e164', '')}",
+        mailto_base=f"mailto:{values.get('email', '')}?subject=",
+        map_url=f"https://www.google.com/maps/dir/?api=1&destination={destination}",
+    )
+
+
+# Parsed cards.json and its Card registry, reused until the file's mtime/size change.
+# Published as one (mtime_ns, size, data, cards) tuple so readers never see a mix
+# of old and new values.
+_cards_cache: tuple[int, int, dict | None, dict[str, Card]] = (0, -1, None, {})
+
+
+def _load_cards_snapshot() -> tuple[int, int, dict | None, dict[str, Card]]:
+    global _cards_cache
+    try:
+        st = os.stat(CARDS_FILE)
+    except FileNotFoundError:
         raise RuntimeError("cards.json missing")
-    with open(CARDS_FILE, "r", encoding="utf-8") as f:
-        return json.load(f)
+    snapshot = _cards_cache
+    if st.st_mtime_ns == snapshot[0] and st.st_size == snapshot[1]:
+        return snapshot
+
+    with open(CARDS_FILE, "rb") as f:
+        data = _json_loads(f.read())
+    cards = {
+        slug: _build_card(slug, raw)
+        for slug, raw in data.get("cards", {}).items()
+        if raw and isinstance(raw, dict)
+    }
+    snapshot = (st.st_mtime_ns, st.st_size, data, cards)
+    _cards_cache = snapshot
+    return snapshot
 
 
-def get_card(slug: str):
-    data = load_cards()
-    card = data.get("cards", {}).get(slug)
-    if not card:
-        return None
-    card = dict(card)
-    card["slug"] = slug
-    return card
+def load_cards():
+    return _load_cards_snapshot()[2]
+
+
+def _cards_snapshot():
+    """cards.json snapshot for the current request, checked against disk once."""
+    if not has_app_context():
+        return _load_cards_snapshot()
+    if "cards_snapshot" not in g:
+        g.cards_snapshot = _load_cards_snapshot()
+    return g.cards_snapshot
+
+
+def _cards_data():
+    return _cards_snapshot()[2]
+
+
+def load_card_registry() -> dict[str, Card]:
+    return _cards_snapshot()[3]
+
+
+def get_card(slug: str) -> Card | None:
+    return load_card_registry().get(slug)
 
 
 def get_default_slug():
-    data = load_cards()
+    data = _cards_data()
     return data.get("default_slug", "wjm")
 
 
@@ -76,15 +187,24 @@ DEFAULT_COUNTERS = {
 
 def _save_counters(data: dict):
     tmp = COUNTERS_FILE + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    with open(tmp, "wb") as f:
+        # Compact output: this runs on every flush, nobody reads it by hand
+        f.write(_json_dumps(data))
     os.replace(tmp, COUNTERS_FILE)
 
 
+def _coerce_count(value) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError, OverflowError):
+        return 0
+
+
 def _load_counters() -> dict:
     """Load counters from disk.
 
-    Stored shape is {slug: {counter_key: int, ...}, ...}.
+    Stored shape is {slug: {counter_key: int, ...}, ...}; each slug is
+    returned as a Counter with int values so increments need no coercion.
     Also supports migrating older flat dicts into the per-slug format.
     """
     if not os.path.exists(COUNTERS_FILE):
@@ -92,8 +212,8 @@ def _load_counters() -> dict:
         return {}
 
     try:
-        with open(COUNTERS_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(COUNTERS_FILE, "rb") as f:
+            data = _json_loads(f.read())
         if not isinstance(data, dict):
             data = {}
 
@@ -112,51 +232,239 @@ def _load_counters() -> dict:
                 migrated[default_slug][k] = int(data.get(k, v))
             data = migrated
             _save_counters(data)
-
-        return data
     except Exception:
         # If file is corrupted, reset safely
         _save_counters({})
         return {}
 
+    # Coerce value by value so one bad entry can't wipe the whole store
+    return {
+        slug: Counter({k: _coerce_count(v) for k, v in card_data.items()})
+        for slug, card_data in data.items()
+        if isinstance(card_data, dict)
+    }
+
+
+# Counters live in memory. Each click is also appended to COUNTERS_LOG_FILE as
+# a "slug key" line; a background thread periodically compacts the log into
+# COUNTERS_FILE. On startup, logs not yet compacted are replayed so no clicks
+# are lost.
+#
+# This assumes a single process owns the counters (e.g. gunicorn --workers 1
+# --threads N): every process keeps its own in-memory counts and would
+# overwrite COUNTERS_FILE and the shared log with them.
+COUNTERS_LOG_FILE = os.environ.get(
+    "COUNTERS_LOG_FILE", os.path.splitext(COUNTERS_FILE)[0] + ".log"
+)
+COUNTERS_FLUSH_INTERVAL = float(os.environ.get("COUNTERS_FLUSH_INTERVAL", "60"))
 
-def increment_counter(slug: str, key: str) -> int:
-    data = _load_counters()
-    card_data = data.get(slug, {})
-    for k, v in DEFAULT_COUNTERS.items():
-        card_data.setdefault(k, v)
-
-    card_data[key] = int(card_data.get(key, 0)) + 1
-    data[slug] = card_data
-    _save_counters(data)
+# Each log starts with a "#gen N" header. COUNTERS_FILE records the newest
+# generation already folded into it, so a log left behind by a crash
+# mid-compaction is not replayed twice.
+_COUNTERS_ROTATED_LOG_FILE = COUNTERS_LOG_FILE + ".1"
+_COMPACTED_KEY = "_compacted_log"
+
+_counters_lock = threading.Lock()
+_counters_dirty = False
+
+
+def _bump_counter(data: dict, slug: str, key: str) -> int:
+    card_data = data.get(slug)
+    if card_data is None:
+        card_data = data[slug] = Counter(DEFAULT_COUNTERS)
+    card_data[key] += 1
     return card_data[key]
 
 
+def _read_compacted_generation() -> int:
+    try:
+        with open(COUNTERS_FILE, "rb") as f:
+            data = _json_loads(f.read())
+        return _coerce_count(data.get(_COMPACTED_KEY, 0))
+    except Exception:
+        return 0
+
+
+def _replay_counters_log(path: str, data: dict, compacted_gen: int) -> int | None:
+    """Fold clicks from one log file into data unless it was already compacted.
+
+    Returns the log's generation, or None if the file does not exist.
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        header = f.readline()
+        if header.startswith("#gen "):
+            gen = _coerce_count(header[5:])
+        else:
+            # No header (log from an older version): treat it as pending
+            gen = compacted_gen + 1
+            f.seek(0)
+        if gen <= compacted_gen:
+            return gen
+        for line in f:
+            parts = line.rstrip("\n").rsplit(" ", 1)
+            if len(parts) != 2 or not parts[0]:
+                # Partial line from an interrupted write
+                continue
+            _bump_counter(data, parts[0], parts[1])
+    return gen
+
+
+def _open_counters_log(gen: int):
+    # Append mode + line buffering: every click reaches the OS immediately (no fsync)
+    log = open(COUNTERS_LOG_FILE, "a", encoding="utf-8", buffering=1)
+    log.write(f"#gen {gen}\n")
+    return log
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+_counters_mem = _load_counters()
+_counters_gen = _read_compacted_generation()
+_log_gens = [
+    gen
+    for gen in (
+        _replay_counters_log(_COUNTERS_ROTATED_LOG_FILE, _counters_mem, _counters_gen),
+        _replay_counters_log(COUNTERS_LOG_FILE, _counters_mem, _counters_gen),
+    )
+    if gen is not None
+]
+if _log_gens:
+    _counters_gen = max(_counters_gen, *_log_gens)
+    _save_counters({**_counters_mem, _COMPACTED_KEY: _counters_gen})
+    _remove_file(_COUNTERS_ROTATED_LOG_FILE)
+    _remove_file(COUNTERS_LOG_FILE)
+_counters_gen += 1
+_counters_log = _open_counters_log(_counters_gen)
+
+
+def _rotate_counters_log() -> int:
+    """Start a fresh log; return the generation of the one moved aside."""
+    global _counters_log, _counters_gen
+    # Close before renaming: Windows can't rename a file that is still open
+    _counters_log.close()
+    try:
+        if os.path.exists(_COUNTERS_ROTATED_LOG_FILE):
+            # An earlier compaction failed after rotating. Fold this log into
+            # it; the generation saved below covers both files.
+            with open(COUNTERS_LOG_FILE, "r", encoding="utf-8") as src:
+                src.readline()  # header
+                pending = src.read()
+            with open(_COUNTERS_ROTATED_LOG_FILE, "a", encoding="utf-8") as dst:
+                dst.write(pending)
+            os.remove(COUNTERS_LOG_FILE)
+        else:
+            os.replace(COUNTERS_LOG_FILE, _COUNTERS_ROTATED_LOG_FILE)
+    except OSError:
+        # Keep logging to the current file; the next flush retries the rotation
+        _counters_log = open(COUNTERS_LOG_FILE, "a", encoding="utf-8", buffering=1)
+        raise
+    rotated_gen = _counters_gen
+    _counters_gen += 1
+    _counters_log = _open_counters_log(_counters_gen)
+    return rotated_gen
+
+
+def _flush_counters() -> None:
+    """Compact the log: rotate it, write COUNTERS_FILE, then drop the rotated log."""
+    global _counters_dirty
+    with _counters_lock:
+        if not _counters_dirty:
+            return
+        rotated_gen = _rotate_counters_log()
+        _save_counters({**_counters_mem, _COMPACTED_KEY: rotated_gen})
+        _remove_file(_COUNTERS_ROTATED_LOG_FILE)
+        _counters_dirty = False
+
+
+def _counters_flush_loop() -> None:
+    while True:
+        time.sleep(COUNTERS_FLUSH_INTERVAL)
+        try:
+            _flush_counters()
+        except Exception:
+            # The dirty flag stays set, so the next tick retries
+            app.logger.exception("Failed to flush counters to %s", COUNTERS_FILE)
+
+
+threading.Thread(target=_counters_flush_loop, name="counters-flush", daemon=True).start()
+atexit.register(_flush_counters)
+
+
+def _counters_snapshot() -> dict:
+    with _counters_lock:
+        return {slug: dict(card_data) for slug, card_data in _counters_mem.items()}
+
+
+def _counters_for_request() -> dict:
+    """Snapshot of all counters for the admin views, taken at most once per request."""
+    if "counters" not in g:
+        g.counters = _counters_snapshot()
+    return g.counters
+
+
+def increment_counter(slug: str, key: str) -> int:
+    global _counters_dirty
+    with _counters_lock:
+        value = _bump_counter(_counters_mem, slug, key)
+        _counters_log.write(f"{slug} {key}\n")
+        _counters_dirty = True
+        return value
+
+
+def reset_counters() -> None:
+    global _counters_dirty
+    with _counters_lock:
+        rotated_gen = _rotate_counters_log()
+        _save_counters({_COMPACTED_KEY: rotated_gen})
+        # Only drop the in-memory counts once the reset is on disk
+        _counters_mem.clear()
+        _remove_file(_COUNTERS_ROTATED_LOG_FILE)
+        _counters_dirty = False
+
+
 def get_counters(slug: str) -> dict:
-    data = _load_counters()
-    card_data = data.get(slug, {})
-    for k, v in DEFAULT_COUNTERS.items():
-        card_data.setdefault(k, v)
-    return card_data
+    with _counters_lock:
+        card_data = _counters_mem.get(slug)
+        return {**DEFAULT_COUNTERS, **card_data} if card_data else dict(DEFAULT_COUNTERS)
 
 
 def is_admin_logged_in() -> bool:
-    return bool(session.get("admin_logged_in"))
+    if "admin_logged_in" not in g:
+        g.admin_logged_in = bool(session.get("admin_logged_in"))
+    return g.admin_logged_in
+
+
+# Parsed admin_auth.json hash, reused until the file's mtime changes.
+_admin_auth_cache = {"mtime_ns": -1, "hash": None}
 
 
 def _load_admin_password_hash() -> str | None:
     """Load persisted admin password hash if present."""
     try:
-        if os.path.exists(ADMIN_AUTH_FILE):
-            with open(ADMIN_AUTH_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            ph = data.get("password_hash")
-            if isinstance(ph, str) and ph.strip():
-                return ph.strip()
+        st = os.stat(ADMIN_AUTH_FILE)
+    except OSError:
+        return None
+    if st.st_mtime_ns == _admin_auth_cache["mtime_ns"]:
+        return _admin_auth_cache["hash"]
+
+    try:
+        with open(ADMIN_AUTH_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        ph = data.get("password_hash")
+        ph = ph.strip() if isinstance(ph, str) and ph.strip() else None
     except Exception:
         # Don't crash app if file is corrupt; fall back to env password
-        return None
-    return None
+        ph = None
+    _admin_auth_cache["mtime_ns"] = st.st_mtime_ns
+    _admin_auth_cache["hash"] = ph
+    return ph
 
 
 def _save_admin_password_hash(password_hash: str) -> None:
@@ -164,38 +472,68 @@ def _save_admin_password_hash(password_hash: str) -> None:
     with open(tmp, "w", encoding="utf-8") as f:
         json.dump({"password_hash": password_hash}, f, indent=2)
     os.replace(tmp, ADMIN_AUTH_FILE)
-
+    _admin_auth_cache["mtime_ns"] = os.stat(ADMIN_AUTH_FILE).st_mtime_ns
+    _admin_auth_cache["hash"] = password_hash
+
+
+# Recent check_password_hash results: (hash, HMAC(pw)) -> (result, expires_at).
+# Avoids paying for pbkdf2/scrypt on repeated logins with the same password.
+# The HMAC key is random per process, so cache keys can't be brute-forced
+# offline the way a plain fast hash of the password could.
+PASSWORD_CACHE_TTL = 300
+PASSWORD_CACHE_MAX = 64
+_password_cache: dict[tuple[str, str], tuple[bool, float]] = {}
+_password_cache_lock = threading.Lock()
+_password_cache_key = os.urandom(32)
+
+
+def _verify_password(password_hash: str, pw: str) -> bool:
+    pw_mac = hmac.new(_password_cache_key, pw.encode("utf-8"), "sha256").hexdigest()
+    key = (password_hash, pw_mac)
+    now = time.monotonic()
+    with _password_cache_lock:
+        cached = _password_cache.get(key)
+    if cached and cached[1] > now:
+        return cached[0]
+
+    result = check_password_hash(password_hash, pw)
+    with _password_cache_lock:
+        if len(_password_cache) >= PASSWORD_CACHE_MAX:
+            for k in [k for k, (_, expires_at) in _password_cache.items() if expires_at <= now]:
+                del _password_cache[k]
+            while len(_password_cache) >= PASSWORD_CACHE_MAX:
+                # Still full: drop the oldest entries
+                del _password_cache[next(iter(_password_cache))]
+        _password_cache[key] = (result, now + PASSWORD_CACHE_TTL)
+    return result
 
 
 def password_ok(pw: str) -> bool:
     # 1) Prefer persisted hash (allows reset without changing Render env vars)
     persisted = _load_admin_password_hash()
     if persisted:
-        return check_password_hash(persisted, pw)
+        return _verify_password(persisted, pw)
 
     # 2) Fallback to env var (supports either a hash or plain text)
     if ADMIN_PASSWORD.startswith("pbkdf2:") or ADMIN_PASSWORD.startswith("scrypt:"):
-        return check_password_hash(ADMIN_PASSWORD, pw)
+        return _verify_password(ADMIN_PASSWORD, pw)
     return pw == ADMIN_PASSWORD
 
 
 
 def build_admin_rows():
-    cards_data = load_cards()
-    cards = cards_data.get("cards", {})
-    all_counters = _load_counters()
+    cards = load_card_registry()
+    all_counters = _counters_for_request()
 
     rows = []
     for slug, c in cards.items():
-        counters = all_counters.get(slug, {})
-        for k, v in DEFAULT_COUNTERS.items():
-            counters.setdefault(k, v)
+        counters = {**DEFAULT_COUNTERS, **all_counters.get(slug, {})}
 
         rows.append(
             {
                 "slug": slug,
-                "display_name": c.get("display_name", slug),
-                "contact_save_name": c.get("contact_save_name", ""),
+                "display_name": c.display_name or slug,
+                "contact_save_name": c.contact_save_name,
                 "contact_shared": counters.get("contact_shared", 0),
                 "whatsapp_clicks": counters.get("whatsapp_clicks", 0),
                 "email_clicks": counters.get("email_clicks", 0),
@@ -209,6 +547,89 @@ def build_admin_rows():
     rows.sort(key=lambda r: r["slug"])
     return rows
 
+
+# Base64 vCard photos keyed by path, reused while the file's mtime/size match.
+_photo_cache: dict[str, tuple[int, int, str]] = {}
+
+
+def _encoded_photo(image_path: Path) -> str:
+    try:
+        st = image_path.stat()
+        key = str(image_path)
+        cached = _photo_cache.get(key)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        encoded_image = base64.b64encode(image_path.read_bytes()).decode("ascii")
+    except Exception:
+        return ""
+    _photo_cache[key] = (st.st_mtime_ns, st.st_size, encoded_image)
+    return encoded_image
+
+
+_VCF_HEAD = (
+    "BEGIN:VCARD\r\n"
+    "VERSION:3.0\r\n"
+    "FN:{contact_save_name}\r\n"
+    "ORG:{org}\r\n"
+    "TITLE:{title}\r\n"
+    "TEL;TYPE=CELL,VOICE:+{whatsapp_e164}\r\n"
+    "TEL;TYPE=WORK,VOICE:+{office_e164}\r\n"
+    "EMAIL;TYPE=WORK:{email}\r\n"
+    "URL:{website_url}\r\n"
+)
+_VCF_NO_PHOTO = _VCF_HEAD + "END:VCARD\r\n"
+_VCF_WITH_PHOTO = _VCF_HEAD + "PHOTO;ENCODING=b;TYPE=JPEG:{photo}\r\nEND:VCARD\r\n"
+
+# Serialized vCards keyed by slug, reused while cards.json and the photo are unchanged.
+_vcf_cache: dict[str, tuple[int, int, bytes]] = {}
+
+
+# QR PNGs keyed by (host URL, slug) -> (png bytes, etag); output is deterministic.
+# The host comes from the client's Host header, so keep it a bounded LRU.
+QR_CACHE_MAX = 128
+_qr_cache: OrderedDict[tuple[str, str], tuple[bytes, str]] = OrderedDict()
+_qr_cache_lock = threading.Lock()
+
+
+# Static file mtimes used as ?v= versions: filename -> (mtime_ns, checked_at).
+# Re-stat'ed at most every ASSET_VERSION_TTL seconds.
+ASSET_VERSION_TTL = 10
+_asset_versions: dict[str, tuple[int, float]] = {}
+
+
+def _asset_version(filename: str) -> int:
+    now = time.monotonic()
+    cached = _asset_versions.get(filename)
+    if cached and now - cached[1] < ASSET_VERSION_TTL:
+        return cached[0]
+    try:
+        version = os.stat(os.path.join(app.static_folder, filename)).st_mtime_ns
+    except OSError:
+        version = 0
+    _asset_versions[filename] = (version, now)
+    return version
+
+
+@app.context_processor
+def asset_helpers():
+    def asset_url(filename: str) -> str:
+        # ?v= changes whenever the file does, so the URL can be cached forever
+        return url_for("static", filename=filename, v=_asset_version(filename))
+
+    return {"asset_url": asset_url}
+
+
+@app.after_request
+def static_cache_headers(resp):
+    # Let browsers/proxies keep logos and photos instead of revalidating every view
+    if request.path.startswith("/static/") and resp.status_code in (200, 304):
+        if request.args.get("v"):
+            resp.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        else:
+            resp.headers["Cache-Control"] = "public, max-age=86400"
+    return resp
+
+
 @app.get("/")
 def home():
     return redirect(f"/c/{get_default_slug()}", code=302)
@@ -226,7 +647,9 @@ def vcard():
 
 @app.get("/favicon.ico")
 def favicon():
-    return send_from_directory("static", "favicon.ico")
+    resp = send_from_directory("static", "favicon.ico")
+    resp.headers["Cache-Control"] = "public, max-age=604800, immutable"
+    return resp.make_conditional(request)
 
 
 @app.get("/go/whatsapp/<slug>")
@@ -236,20 +659,24 @@ def go_whatsapp(slug):
         return abort(404)
     increment_counter(slug, "whatsapp_clicks")
     msg = request.args.get("text", "")
-    base = f"https://wa.me/{c['whatsapp_e164']}"
+    base = c.wa_base
     if msg:
         return redirect(base + "?text=" + quote(msg), code=302)
     return redirect(base, code=302)
 
 
+_DEFAULT_SUBJECT_Q = quote("Enquiry from Website")
+
+
 @app.get("/go/email/<slug>")
 def go_email(slug):
     c = get_card(slug)
     if not c:
         return abort(404)
     increment_counter(slug, "email_clicks")
-    subject = request.args.get("subject", "Enquiry from Website")
-    return redirect(f"mailto:{c['email']}?subject={quote(subject)}", code=302)
+    subject = request.args.get("subject")
+    subject_q = _DEFAULT_SUBJECT_Q if subject is None else quote(subject)
+    return redirect(c.mailto_base + subject_q, code=302)
 
 
 @app.get("/go/map/<slug>")
@@ -258,8 +685,7 @@ def go_map(slug):
     if not c:
         return abort(404)
     increment_counter(slug, "map_clicks")
-    destination = c.get("maps_destination", "208%20Weltevreden%20Road%2C%20Northcliff")
-    return redirect(f"https://www.google.com/maps/dir/?api=1&destination={destination}", code=302)
+    return redirect(c.map_url, code=302)
 
 
 @app.route("/admin", methods=["GET"])
@@ -278,40 +704,43 @@ def admin_export_csv():
 
     rows = build_admin_rows()
 
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow([
-        "slug",
-        "display_name",
-        "contact_save_name",
-        "contact_shared",
-        "whatsapp_clicks",
-        "email_clicks",
-        "map_clicks",
-        "share_clicks",
-        "nfc_scans",
-        "card_url",
-    ])
-    for r in rows:
+    def generate():
+        # Stream one CSV line at a time instead of building the whole file
+        buf = io.StringIO()
+        writer = csv.writer(buf)
         writer.writerow([
-            r["slug"],
-            r["display_name"],
-            r["contact_save_name"],
-            r["contact_shared"],
-            r["whatsapp_clicks"],
-            r["email_clicks"],
-            r["map_clicks"],
-            r["share_clicks"],
-            r["nfc_scans"],
-            r["card_url"],
+            "slug",
+            "display_name",
+            "contact_save_name",
+            "contact_shared",
+            "whatsapp_clicks",
+            "email_clicks",
+            "map_clicks",
+            "share_clicks",
+            "nfc_scans",
+            "card_url",
         ])
-
-    csv_data = output.getvalue()
-    output.close()
+        yield buf.getvalue()
+        for r in rows:
+            buf.seek(0)
+            buf.truncate()
+            writer.writerow([
+                r["slug"],
+                r["display_name"],
+                r["contact_save_name"],
+                r["contact_shared"],
+                r["whatsapp_clicks"],
+                r["email_clicks"],
+                r["map_clicks"],
+                r["share_clicks"],
+                r["nfc_scans"],
+                r["card_url"],
+            ])
+            yield buf.getvalue()
 
     ts = datetime.datetime.utcnow().strftime("%Y%m%d-%H%M%S")
     return Response(
-        csv_data,
+        generate(),
         mimetype="text/csv; charset=utf-8",
         headers={"Content-Disposition": f"attachment; filename=card-stats-{ts}.csv"},
     )
@@ -323,6 +752,7 @@ def admin_login():
         pw = request.form.get("password", "")
         if password_ok(pw):
             session["admin_logged_in"] = True
+            g.pop("admin_logged_in", None)
             return redirect(url_for("admin"), code=302)
         return render_template("admin_login.html", error="Incorrect password.")
     return render_template("admin_login.html", error=None)
@@ -331,6 +761,7 @@ def admin_login():
 @app.post("/admin/logout")
 def admin_logout():
     session.pop("admin_logged_in", None)
+    g.pop("admin_logged_in", None)
     return redirect(url_for("admin_login"), code=302)
 
 
@@ -374,7 +805,10 @@ def admin_password_reset():
 
         # Persist new password hash so you don't need to change Render env vars.
         _save_admin_password_hash(generate_password_hash(new_pw))
+        with _password_cache_lock:
+            _password_cache.clear()
         session.pop("admin_logged_in", None)
+        g.pop("admin_logged_in", None)
         return render_template(
             "admin_password_reset.html",
             error=None,
@@ -388,7 +822,7 @@ def admin_password_reset():
 def admin_reset_counters():
     if not is_admin_logged_in():
         return redirect(url_for("admin_login"), code=302)
-    _save_counters({})
+    reset_counters()
     return redirect(url_for("admin"), code=302)
 
 
@@ -404,12 +838,46 @@ def qr_png_slug(slug):
     if not c:
         return abort(404)
     base_url = request.host_url.rstrip("/")
-    url = base_url + "/go/nfc/" + slug  # track scans
-    img = qrcode.make(url)
-    buf = io.BytesIO()
-    img.save(buf, format="PNG")
-    buf.seek(0)
-    return Response(buf.getvalue(), mimetype="image/png")
+    key = (base_url, slug)
+    with _qr_cache_lock:
+        cached = _qr_cache.get(key)
+        if cached is not None:
+            _qr_cache.move_to_end(key)
+    if cached is None:
+        # Imported lazily: qrcode pulls in PIL, which most workers never need
+        import qrcode
+
+        url = base_url + "/go/nfc/" + slug  # track scans
+        # Fixed settings keep the output deterministic. Low error correction
+        # and light zlib compression make the first render cheap; box size and
+        # the 4-module quiet zone stay at the defaults so printed codes scan.
+        qr = qrcode.QRCode(
+            version=None,
+            error_correction=qrcode.constants.ERROR_CORRECT_L,
+            box_size=10,
+            border=4,
+        )
+        qr.add_data(url)
+        qr.make(fit=True)
+        buf = io.BytesIO()
+        qr.make_image().save(buf, format="PNG", optimize=False, compress_level=1)
+        png = buf.getvalue()
+        cached = (png, hashlib.md5(png).hexdigest())
+        with _qr_cache_lock:
+            _qr_cache[key] = cached
+            while len(_qr_cache) > QR_CACHE_MAX:
+                _qr_cache.popitem(last=False)
+
+    png, etag = cached
+    resp = Response(png, mimetype="image/png")
+    resp.headers["Cache-Control"] = "public, max-age=86400"
+    resp.set_etag(etag)
+    return resp.make_conditional(request)
+
+
+# Rendered card pages keyed by slug -> (cards.json and asset mtimes, html with placeholder).
+_SHARE_COUNT_PLACEHOLDER = "__SHARE_COUNT__"
+_card_html_cache: dict[str, tuple[tuple[int, int, int], bytes]] = {}
 
 
 @app.get("/c/<slug>")
@@ -417,26 +885,46 @@ def card(slug):
     c = get_card(slug)
     if not c:
         return abort(404)
+    photo_filename = c.photo_filename
+    logo_filename = c.logo_filename
+    version = (
+        _cards_snapshot()[0],
+        _asset_version(photo_filename),
+        _asset_version(logo_filename),
+    )
+    cached = _card_html_cache.get(slug)
+    if cached and cached[0] == version:
+        html = cached[1]
+    else:
+        # Only the share count changes between views; render once with a
+        # placeholder and fill it in per request.
+        html = render_template(
+            "card.html",
+            share_count=_SHARE_COUNT_PLACEHOLDER,
+            display_name=c.display_name,
+            contact_save_name=c.contact_save_name,
+            org=c.org,
+            title=c.title,
+            whatsapp_display=c.whatsapp_display,
+            whatsapp_e164=c.whatsapp_e164,
+            office_display=c.office_display,
+            office_e164=c.office_e164,
+            email=c.email,
+            website_display=c.website_display,
+            website_url=c.website_url,
+            address_text=c.address_text,
+            maps_destination=c.maps_destination,
+            photo_filename=photo_filename,
+            logo_filename=logo_filename,
+            slug=slug,
+        ).encode("utf-8")
+        _card_html_cache[slug] = (version, html)
+
     counters = get_counters(slug)
-    return render_template(
-        "card.html",
-        share_count=counters.get("contact_shared", 0),
-        display_name=c["display_name"],
-        contact_save_name=c["contact_save_name"],
-        org=c["org"],
-        title=c["title"],
-        whatsapp_display=c["whatsapp_display"],
-        whatsapp_e164=c["whatsapp_e164"],
-        office_display=c["office_display"],
-        office_e164=c["office_e164"],
-        email=c["email"],
-        website_display=c["website_display"],
-        website_url=c["website_url"],
-        address_text=c["address_text"],
-        maps_destination=c["maps_destination"],
-        photo_filename=c.get("photo_filename", "profile.jpg"),
-        logo_filename=c.get("logo_filename", "logo.png"),
-        slug=slug,
+    share_count = str(counters.get("contact_shared", 0)).encode("ascii")
+    return Response(
+        html.replace(_SHARE_COUNT_PLACEHOLDER.encode("ascii"), share_count),
+        mimetype="text/html",
     )
 
 
@@ -448,29 +936,21 @@ def vcard_slug(slug):
 
     increment_counter(slug, "contact_shared")
 
-    image_path = Path("static") / c.get("photo_filename", "profile.jpg")
-    encoded_image = ""
+    image_path = Path("static") / c.photo_filename
     try:
-        encoded_image = base64.b64encode(image_path.read_bytes()).decode("utf-8")
-    except Exception:
-        encoded_image = ""
-
-    lines = [
-        "BEGIN:VCARD",
-        "VERSION:3.0",
-        f"FN:{c['contact_save_name']}",
-        f"ORG:{c['org']}",
-        f"TITLE:{c['title']}",
-        f"TEL;TYPE=CELL,VOICE:+{c['whatsapp_e164']}",
-        f"TEL;TYPE=WORK,VOICE:+{c['office_e164']}",
-        f"EMAIL;TYPE=WORK:{c['email']}",
-        f"URL:{c['website_url']}",
-    ]
-    if encoded_image:
-        lines.append(f"PHOTO;ENCODING=b;TYPE=JPEG:{encoded_image}")
-    lines += ["END:VCARD", ""]
-
-    vcf = "\r\n".join(lines)
+        photo_mtime = image_path.stat().st_mtime_ns
+    except OSError:
+        photo_mtime = -1
+    cards_mtime = _cards_snapshot()[0]
+
+    cached = _vcf_cache.get(slug)
+    if cached and cached[0] == cards_mtime and cached[1] == photo_mtime:
+        vcf = cached[2]
+    else:
+        encoded_image = _encoded_photo(image_path)
+        template = _VCF_WITH_PHOTO if encoded_image else _VCF_NO_PHOTO
+        vcf = template.format_map({**asdict(c), "photo": encoded_image}).encode("utf-8")
+        _vcf_cache[slug] = (cards_mtime, photo_mtime, vcf)
 
     safe_name = slug.replace("/", "_")
     return Response(